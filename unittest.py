@@ -1,119 +1,228 @@
 # static_analyzer.py
 import ast
+import atexit
+import builtins
+import collections
+import keyword
 import sys
 import re
+import subprocess
 import time
+from pathlib import Path
+
+# 预编译的正则表达式，避免在逐行扫描时重复查找/编译
+_DIV_RE1 = re.compile(r'/(\s*0\b|\b0\.0)')  # 直接除以零
+_DIV_RE2 = re.compile(r'/.*\b0\b.*[^\.]')  # 可能间接除以零
+_SHADOW_RE = re.compile(r'^\s*(\w+)\s*=')  # 变量赋值
+# 内置函数/类型及关键字名称（不含以下划线开头的内部名称）
+_BUILTINS = frozenset(
+    name for name in dir(builtins) if not name.startswith('_')
+) | frozenset(keyword.kwlist)
+# 输入验证模式合并为一个分支表达式，每行只需扫描一次
+# （原 r'if\s+.*\.isdigit\(\)' 已被 r'\.isdigit\(\)' 覆盖）
+_VALIDATION_RE = re.compile(
+    r'\.isdigit\(\)'
+    r'|try\s*:'
+    r'|except\s+ValueError'
+    r'|isinstance\(.*,\s*(?:int|float|str)\)',
+    re.IGNORECASE
+)
+# 每个模式附带一个必然出现的子串，先用 in 判断再跑正则
+_BUG_PATTERNS = [(re.compile(p), d, k) for p, d, k in [
+    (r'while\s+True\s*:', "无限循环风险", 'while'),
+    (r'if\s+=\s+', "可能误用赋值操作符", 'if'),
+    (r'==\s+None', "应使用'is None'而不是'== None'", 'None'),
+    (r'except\s*:', "过于宽泛的异常捕获", 'except'),
+    (r'print\s+[^(]', "print语句缺少括号", 'print'),
+    (r'input\s*\([^)]*\)\.', "input()结果直接调用方法，可能为None", 'input'),
+]]
+# 所有bug模式的并集：绝大多数行一次扫描即可排除，命中时再逐个确认
+_BUG_RE = re.compile('|'.join(f'(?:{p.pattern})' for p, _, _ in _BUG_PATTERNS))
+_IMPORT_RE = re.compile(r'^(?:import\s+(\w+)|from\s+(\w+)\s+import)')
 
 # 以下为包装好的 Logger 类的定义
 class Logger(object):
     def __init__(self, filename="Default.log"):
         self.terminal = sys.stdout
-        self.log = open(filename, "w", encoding="utf-8")  # 防止编码错误
+        # 二进制模式直接写入UTF-8字节（防止编码错误，且绕过文本层）；
+        # 64KiB缓冲，避免每次print都触发一次写文件，退出时关闭以写出剩余内容
+        self.log = open(filename, "wb", buffering=1 << 16)
+        atexit.register(self.log.close)
 
     def write(self, message):
         self.terminal.write(message)
-        self.log.write(message)
+        self.log.write(message.encode("utf-8"))
+
+    def writelines(self, lines):
+        # lines可能是生成器，只能遍历一次，逐条交给write同时写两个流
+        for line in lines:
+            self.write(line)
 
     def flush(self):
-        pass
+        self.terminal.flush()
+        if not self.log.closed:  # 解释器退出时可能在atexit关闭文件之后再次flush
+            self.log.flush()
+
+
+# 单次遍历AST，收集各分析器所需的统计信息
+class StatsVisitor(object):
+    def __init__(self):
+        # 节点类型 -> 该类型的全部节点（按源码顺序），按类型统计/查找时无需再遍历
+        self.nodes_by_type = collections.defaultdict(list)
+        # 按源码顺序（深度优先）记录的函数定义；与ast.walk的广度优先不同，
+        # 嵌套函数和类中方法紧跟在其外层定义之后输出
+        self.func_defs = []
+        self.used_names = set()
+        self.defined_names = set()
+        self.input_nodes = []
+        # 节点类型 -> 绑定方法，省去NodeVisitor按'visit_'+类名拼接查找的开销
+        self._dispatch = {
+            ast.Call: self._on_call,
+            ast.FunctionDef: self._on_func,
+            ast.Assign: self._on_assign,
+            ast.Name: self._on_name,
+        }
+
+    def visit(self, node):
+        # 用显式栈代替递归遍历；子节点逆序入栈，保证出栈顺序与源码顺序一致
+        dispatch = self._dispatch
+        nodes_by_type = self.nodes_by_type
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            t = type(node)
+            nodes_by_type[t].append(node)
+            h = dispatch.get(t)
+            if h:
+                h(node)
+            stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
+    def _on_call(self, node):
+        if isinstance(node.func, ast.Name) and node.func.id == 'input':
+            self.input_nodes.append(node)
+
+    def _on_func(self, node):
+        self.func_defs.append({
+            'name': node.name,
+            'args': [arg.arg for arg in node.args.args],
+            'lineno': node.lineno
+        })
+        self.defined_names.add(node.name)
+        for arg in node.args.args:
+            self.defined_names.add(arg.arg)
+
+    def _on_assign(self, node):
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                self.defined_names.add(target.id)
+
+    def _on_name(self, node):
+        self.used_names.add(node.id)
+
 
 def analyze_file(filepath):
     """主分析函数"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # 一次性读入字节再整体解码；仅在存在\r时才做换行符统一，
+    # 省去文本模式下逐段解码与换行转换的开销
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    content = raw.decode('utf-8')
+    del raw
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
 
     print(f"分析文件: {filepath}")
     print("=" * 80)
 
+    # 按行分析的检查共用同一份行列表
+    # （不用splitlines()：它还会在\f、\v等字符处断行，导致行号与编辑器/AST不一致）
+    lines = content.split('\n')
+
+    # 对整个源码做一次子串查找，特征不存在时对应检查可跳过逐行扫描
+    has_division = '/' in content
+    has_input = 'input(' in content
+    has_import = 'import' in content
+
     # 执行各种分析
-    line_count = analyze_line_count(content)
+    line_count = analyze_line_count(lines)
     print(f"1. 代码行数: {line_count}")
 
-    analyze_syntax_errors(content)
-    analyze_division_by_zero(content)
-    analyze_variable_shadowing(content)
-    analyze_unused_variables(content)
-    analyze_exception_handling(content)
-    analyze_input_validation(content)
-    analyze_potential_bugs(content)
-    analyze_function_definitions(content)
-    analyze_import_statements(content)
-
-    # 更复杂的AST分析
+    # 语法检查：只解析一次，并单次遍历语法树收集统计信息供各AST分析共用；
+    # 存在语法错误时stats为None，后续AST分析直接跳过
+    print("\n2. 语法错误检查:")
     try:
-        tree = ast.parse(content)
-        perform_ast_analysis(tree, content)
+        # 只生成AST、不做常量折叠（会抹掉待检查的除法等节点）；传入文件名使语法错误信息显示实际文件
+        tree = compile(content, filepath, 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
     except SyntaxError as e:
-        print(f"语法错误: {e}")
+        stats = None
+        print(f"   ✗ 语法错误: {e}")
+        print(f"     位置: 第{e.lineno}行, 第{e.offset}列")
+    else:
+        stats = StatsVisitor()
+        stats.visit(tree)
+        print("   ✓ 无语法错误")
+
+    analyze_division_by_zero(lines, has_division)
+    analyze_variable_shadowing(lines)
+    analyze_unused_variables(stats)
+    analyze_exception_handling(stats)
+    analyze_input_validation(lines, has_input)
+    analyze_potential_bugs(lines)
+    analyze_function_definitions(stats)
+    analyze_import_statements(lines, has_import)
+
+    # 更复杂的AST分析
+    perform_ast_analysis(stats)
 
     print("\n" + "=" * 80)
     print("静态分析完成")
 
 
-def analyze_line_count(content):
+def analyze_line_count(lines):
     """统计代码行数"""
-    lines = content.split('\n')
-    non_empty_lines = [line for line in lines if line.strip()]
-    return len(non_empty_lines)
+    return sum(1 for line in lines if line.strip())
 
 
-def analyze_syntax_errors(content):
-    """检查语法错误"""
-    print("\n2. 语法错误检查:")
-    try:
-        ast.parse(content)
-        print("   ✓ 无语法错误")
-    except SyntaxError as e:
-        print(f"   ✗ 语法错误: {e}")
-        print(f"     位置: 第{e.lineno}行, 第{e.offset}列")
-
-
-def analyze_division_by_zero(content):
+def analyze_division_by_zero(lines, has_division=True):
     """检查除以零的风险"""
     print("\n3. 除以零风险检查:")
 
-    # 正则表达式匹配除法操作
-    division_patterns = [
-        r'/(?!\s*\w+\s*\[)',  # 除法操作符
-        r'divide\s*\([^)]*0[^)]*\)',  # 除以零的调用
-    ]
+    if not has_division:
+        print("   ✓ 未发现明显的除以零风险")
+        return
 
-    lines = content.split('\n')
     found_issues = False
 
     for i, line in enumerate(lines, 1):
-        if '/' in line and '//' not in line:  # 排除整除操作符
+        # 排除整除操作符；两个正则都要求出现字符'0'，先用子串判断过滤
+        if '/' in line and '//' not in line and '0' in line:
             # 检查是否可能除以零
-            if re.search(r'/(\s*0\b|\b0\.0)', line):
-                print(f"   ✗ 第{i}行: 可能除以零 - {line.strip()}")
+            stripped = line.strip()
+            if _DIV_RE1.search(line):
+                print(f"   ✗ 第{i}行: 可能除以零 - {stripped}")
                 found_issues = True
-            elif re.search(r'/.*\b0\b.*[^\.]', line):
-                print(f"   ⚠ 第{i}行: 可能间接除以零 - {line.strip()}")
+            elif _DIV_RE2.search(line):
+                print(f"   ⚠ 第{i}行: 可能间接除以零 - {stripped}")
                 found_issues = True
 
     if not found_issues:
         print("   ✓ 未发现明显的除以零风险")
 
 
-def analyze_variable_shadowing(content):
+def analyze_variable_shadowing(lines):
     """检查变量名与内置函数/关键字冲突"""
     print("\n4. 变量名冲突检查:")
 
-    builtins = [
-        'list', 'dict', 'set', 'str', 'int', 'float', 'bool',
-        'input', 'print', 'sum', 'min', 'max', 'len', 'type',
-        'id', 'range', 'enumerate', 'zip', 'map', 'filter'
-    ]
-
-    lines = content.split('\n')
     found_issues = False
 
     for i, line in enumerate(lines, 1):
-        # 查找变量赋值
-        match = re.match(r'^\s*(\w+)\s*=', line)
+        # 查找变量赋值（不含'='的行不可能是赋值，跳过正则）
+        if '=' not in line:
+            continue
+        match = _SHADOW_RE.match(line)
         if match:
             var_name = match.group(1)
-            if var_name in builtins:
+            if var_name in _BUILTINS:
                 print(f"   ⚠ 第{i}行: 变量名'{var_name}'与内置函数/类型冲突 - {line.strip()}")
                 found_issues = True
 
@@ -121,185 +230,124 @@ def analyze_variable_shadowing(content):
         print("   ✓ 未发现变量名冲突")
 
 
-def analyze_unused_variables(content):
+def analyze_unused_variables(stats):
     """检查未使用的变量（简单实现）"""
     print("\n5. 未使用变量检查:")
 
-    try:
-        tree = ast.parse(content)
-        used_vars = set()
-        defined_vars = set()
-
-        class VariableVisitor(ast.NodeVisitor):
-            def visit_Name(self, node):
-                used_vars.add(node.id)
-
-            def visit_FunctionDef(self, node):
-                defined_vars.add(node.name)
-                for arg in node.args.args:
-                    defined_vars.add(arg.arg)
-                self.generic_visit(node)
-
-            def visit_Assign(self, node):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        defined_vars.add(target.id)
-                self.generic_visit(node)
-
-        visitor = VariableVisitor()
-        visitor.visit(tree)
-
-        # 查找定义但未使用的变量
-        unused = defined_vars - used_vars
-        if unused:
-            for var in unused:
-                print(f"   ⚠ 可能未使用的变量: '{var}'")
-        else:
-            print("   ✓ 未发现明显未使用的变量")
-    except:
-        print("   ⚠ AST分析失败，跳过未使用变量检查")
-
-
-def analyze_exception_handling(content):
-    """检查异常处理"""
-    print("\n6. 异常处理检查:")
+    if stats is None:
+        print("   ⚠ 存在语法错误，跳过未使用变量检查")
+        return
 
-    try:
-        tree = ast.parse(content)
+    # 查找定义但未使用的变量，边判断边输出，不构造差集；
+    # 以下划线开头的名称按惯例表示有意不使用，不报告
+    used_names = stats.used_names
+    found_unused = False
+    for var in stats.defined_names:
+        if var not in used_names and not var.startswith('_'):
+            print(f"   ⚠ 可能未使用的变量: '{var}'")
+            found_unused = True
 
-        class ExceptionVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.division_nodes = []
-                self.input_nodes = []
-                self.has_try_except = False
+    if not found_unused:
+        print("   ✓ 未发现明显未使用的变量")
 
-            def visit_Div(self, node):
-                self.division_nodes.append(node)
 
-            def visit_Call(self, node):
-                if isinstance(node.func, ast.Name) and node.func.id == 'input':
-                    self.input_nodes.append(node)
-                self.generic_visit(node)
+def analyze_exception_handling(stats):
+    """检查异常处理"""
+    print("\n6. 异常处理检查:")
 
-            def visit_Try(self, node):
-                self.has_try_except = True
+    if stats is None:
+        print("   ⚠ 存在语法错误，跳过异常处理检查")
+        return
 
-        visitor = ExceptionVisitor()
-        visitor.visit(tree)
+    idx = stats.nodes_by_type
+    has_try = bool(idx[ast.Try])
 
-        if visitor.division_nodes and not visitor.has_try_except:
-            print("   ⚠ 存在除法操作但没有异常处理，可能导致除以零错误")
-        if visitor.input_nodes and not visitor.has_try_except:
-            print("   ⚠ 存在输入操作但没有异常处理，可能导致类型转换错误")
+    if idx[ast.Div] and not has_try:
+        print("   ⚠ 存在除法操作但没有异常处理，可能导致除以零错误")
+    if stats.input_nodes and not has_try:
+        print("   ⚠ 存在输入操作但没有异常处理，可能导致类型转换错误")
 
-        if not visitor.has_try_except:
-            print("   ⚠ 代码中没有try-except异常处理")
-        else:
-            print("   ✓ 代码包含异常处理")
-    except:
-        print("   ⚠ 无法完成异常处理检查")
+    if not has_try:
+        print("   ⚠ 代码中没有try-except异常处理")
+    else:
+        print("   ✓ 代码包含异常处理")
 
 
-def analyze_input_validation(content):
+def analyze_input_validation(lines, has_input=True):
     """检查输入验证"""
     print("\n7. 输入验证检查:")
 
-    lines = content.split('\n')
-    has_input = False
+    if not has_input:
+        print("   ✓ 未发现用户输入")
+        return
+
+    found_input = False
     has_validation = False
 
     for i, line in enumerate(lines, 1):
         if 'input(' in line:
-            has_input = True
+            found_input = True
             print(f"   ⚠ 第{i}行: 发现用户输入 - {line.strip()}")
 
         # 检查是否包含输入验证
-        validation_patterns = [
-            r'\.isdigit\(\)',
-            r'try\s*:',
-            r'except\s+ValueError',
-            r'if\s+.*\.isdigit\(\)',
-            r'isinstance\(.*,\s*(int|float|str)\)'
-        ]
-
-        for pattern in validation_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                has_validation = True
-
-    if has_input and not has_validation:
+        if not has_validation and _VALIDATION_RE.search(line):
+            has_validation = True
+
+    if found_input and not has_validation:
         print("   ✗ 存在用户输入但没有输入验证，可能导致类型错误或崩溃")
     elif has_validation:
         print("   ✓ 代码包含输入验证")
 
 
-def analyze_potential_bugs(content):
+def analyze_potential_bugs(lines):
     """检查潜在bug模式"""
     print("\n8. 潜在bug模式检查:")
 
-    bug_patterns = [
-        (r'while\s+True\s*:', "无限循环风险"),
-        (r'if\s+=\s+', "可能误用赋值操作符"),
-        (r'==\s+None', "应使用'is None'而不是'== None'"),
-        (r'except\s*:', "过于宽泛的异常捕获"),
-        (r'print\s+[^(]', "print语句缺少括号"),
-        (r'input\s*\([^)]*\)\.', "input()结果直接调用方法，可能为None"),
-    ]
-
-    lines = content.split('\n')
     found_bugs = False
 
     for i, line in enumerate(lines, 1):
-        for pattern, description in bug_patterns:
-            if re.search(pattern, line):
-                print(f"   ⚠ 第{i}行: {description} - {line.strip()}")
+        if not _BUG_RE.search(line):
+            continue
+        stripped = line.strip()
+        for pattern, description, needle in _BUG_PATTERNS:
+            if needle in line and pattern.search(line):
+                print(f"   ⚠ 第{i}行: {description} - {stripped}")
                 found_bugs = True
 
     if not found_bugs:
         print("   ✓ 未发现明显的bug模式")
 
 
-def analyze_function_definitions(content):
+def analyze_function_definitions(stats):
     """分析函数定义"""
     print("\n9. 函数定义分析:")
 
-    try:
-        tree = ast.parse(content)
-        functions = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                functions.append({
-                    'name': node.name,
-                    'args': [arg.arg for arg in node.args.args],
-                    'lineno': node.lineno
-                })
-
-        if functions:
-            for func in functions:
-                print(f"   函数: {func['name']}({', '.join(func['args'])}) - 第{func['lineno']}行")
-        else:
-            print("   ⚠ 未找到函数定义（可能是脚本式代码）")
-    except:
-        print("   ⚠ 函数分析失败")
-
-
-def analyze_import_statements(content):
+    if stats is None:
+        print("   ⚠ 存在语法错误，跳过函数定义分析")
+        return
+
+    if stats.func_defs:
+        for func in stats.func_defs:
+            print(f"   函数: {func['name']}({', '.join(func['args'])}) - 第{func['lineno']}行")
+    else:
+        print("   ⚠ 未找到函数定义（可能是脚本式代码）")
+
+
+def analyze_import_statements(lines, has_import=True):
     """分析导入语句"""
     print("\n10. 导入分析:")
 
-    import_patterns = [
-        (r'^import\s+(\w+)', "导入模块"),
-        (r'^from\s+(\w+)\s+import', "从模块导入")
-    ]
+    if not has_import:
+        print("   ⚠ 未发现导入语句")
+        return
 
-    lines = content.split('\n')
     imports_found = []
 
     for line in lines:
-        for pattern, description in import_patterns:
-            match = re.search(pattern, line)
-            if match:
-                imports_found.append(f"{description}: {line.strip()}")
+        match = _IMPORT_RE.match(line)
+        if match:
+            description = "导入模块" if match.group(1) else "从模块导入"
+            imports_found.append(f"{description}: {line.strip()}")
 
     if imports_found:
         for imp in imports_found:
@@ -308,66 +356,83 @@ def analyze_import_statements(content):
         print("   ⚠ 未发现导入语句")
 
 
-def perform_ast_analysis(tree, content):
+def perform_ast_analysis(stats):
     """执行AST分析"""
     print("\n11. AST深度分析:")
 
-    # 分析循环结构
-    loop_count = 0
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.While, ast.For)):
-            loop_count += 1
+    if stats is None:
+        print("   ⚠ 存在语法错误，跳过AST深度分析")
+        return
 
-    print(f"   循环结构数量: {loop_count}")
+    idx = stats.nodes_by_type
 
-    # 分析条件语句
-    condition_count = 0
-    for node in ast.walk(tree):
-        if isinstance(node, ast.If):
-            condition_count += 1
+    # 分析循环结构
+    print(f"   循环结构数量: {len(idx[ast.For]) + len(idx[ast.While])}")
 
-    print(f"   条件语句数量: {condition_count}")
+    # 分析条件语句
+    print(f"   条件语句数量: {len(idx[ast.If])}")
 
     # 分析函数调用
-    call_count = 0
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Call):
-            call_count += 1
-
-    print(f"   函数调用数量: {call_count}")
-
-    # 检查递归
-    functions = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-            if node.func.id in functions:
-                print(f"   ⚠ 可能递归调用: {node.func.id}()")
+    print(f"   函数调用数量: {len(idx[ast.Call])}")
 
+    # 检查递归：调用了本文件中定义的函数，每个函数只报告一次
+    func_names = frozenset(node.name for node in idx[ast.FunctionDef])
+    reported = set()
+    for call in idx[ast.Call]:
+        func = call.func
+        if isinstance(func, ast.Name) and func.id in func_names and func.id not in reported:
+            reported.add(func.id)
+            print(f"   ⚠ 可能递归调用: {func.id}()")
 
-def run_external_analyzers(filepath):
-    """运行外部静态分析工具"""
-    print("\n12. 运行外部分析工具:")
 
+def start_external_analyzers(filepath):
+    """启动外部静态分析工具（不等待结束），使其与本程序的分析并行运行"""
+    # (工具名, 命令, 完整输出保存的文件)
     tools = [
-        ("pylint", f"pylint {filepath} > Pylint_out.txt")
+        ("pylint", ["pylint", filepath], "Pylint_out.txt")
         #环境配置错误，待匹配
-        #("flake8", f"flake8 {filepath}"),
-        #("pyflakes", f"pyflakes {filepath}")
+        #("flake8", ["flake8", filepath], None),
+        #("pyflakes", ["pyflakes", filepath], None)
     ]
 
-    for tool_name, command in tools:
+    started = []
+    for tool_name, command, output_file in tools:
+        try:
+            # 不经过shell，直接捕获输出
+            proc = subprocess.Popen(command, stdout=subprocess.PIPE,
+                                    stderr=subprocess.PIPE, text=True)
+            started.append((tool_name, proc, output_file, None))
+        except Exception as e:
+            started.append((tool_name, None, output_file, e))
+    return started
+
+
+def run_external_analyzers(filepath, started=None):
+    """收集并输出外部静态分析工具的结果（未提前启动时在此启动）"""
+    print("\n12. 运行外部分析工具:")
+
+    if started is None:
+        started = start_external_analyzers(filepath)
+
+    for tool_name, proc, output_file, error in started:
         print(f"\n   运行 {tool_name}...")
+        if error is not None:
+            print(f"     无法运行 {tool_name}: {error}")
+            continue
         try:
-            import subprocess
-            result = subprocess.run(command, shell=True)
-            if result.stdout:
-                lines = result.stdout.split('\n')
+            stdout, stderr = proc.communicate(timeout=120)
+            if output_file:
+                Path(output_file).write_text(stdout, encoding="utf-8")
+            if stdout:
+                lines = stdout.split('\n')
                 for line in lines[:10]:  # 只显示前10行
                     if line.strip():
                         print(f"      {line}")
-            if result.stderr:
-                print(f"     {tool_name} 错误: {result.stderr[:200]}")
+            if stderr:
+                print(f"     {tool_name} 错误: {stderr[:200]}")
         except Exception as e:
+            proc.kill()
+            proc.communicate()
             print(f"     无法运行 {tool_name}: {e}")
 
 if __name__ == "__main__":
@@ -387,7 +452,10 @@ if __name__ == "__main__":
     log = Logger(filename)
     sys.stdout = log
 
+    # 先启动外部分析器，使其与本程序的分析并行运行
+    external = start_external_analyzers(filepath)
     # 运行分析器
     analyze_file(filepath)
-    # 运行外部分析器
-    run_external_analyzers(filepath)
\ No newline at end of file
+    # 收集外部分析器结果
+    run_external_analyzers(filepath, external)
+    log.flush()